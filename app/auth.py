@@ -1,9 +1,28 @@
-from datetime import datetime, timedelta
-from jose import jwt
+import os
+import threading
+import time
+import jwt
 
-SECRET_KEY = "secret123"
+# No default on purpose: a missing secret must stop the app, not fall back to a known key
+SECRET_KEY = os.environ["JWT_SECRET"]
 ALGORITHM = "HS256"
+TOKEN_TTL = 3600
+# Reissue once the cached token has less than this many seconds left
+TOKEN_REFRESH_MARGIN = 60
+
+_token_lock = threading.Lock()
+_cached_token = (None, 0)
 
 def create_access_token():
-    payload = {"sub": "admin", "exp": datetime.utcnow() + timedelta(hours=1)}
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    global _cached_token
+    token, exp = _cached_token
+    if exp - time.time() > TOKEN_REFRESH_MARGIN:
+        return token
+    with _token_lock:
+        token, exp = _cached_token
+        now = time.time()
+        if exp - now <= TOKEN_REFRESH_MARGIN:
+            exp = int(now) + TOKEN_TTL
+            token = jwt.encode({"sub": "admin", "exp": exp}, SECRET_KEY, algorithm=ALGORITHM)
+            _cached_token = (token, exp)
+        return token
@@ -1,5 +1,82 @@
-from sqlalchemy.orm import Session
+import os
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from .models import Employee
+from .schemas import EmployeeResponse, EmployeePage
 
-def get_employee_by_email(db: Session, email: str):
-    return db.query(Employee).filter(Employee.email == email).first()
+PAGE_SIZE = 10
+# Columns serialized by EmployeeResponse; list rows skip ORM instance construction
+LIST_COLUMNS = (
+    Employee.id,
+    Employee.name,
+    Employee.email,
+    Employee.department,
+    Employee.role,
+    Employee.date_joined,
+)
+
+# Per-process cache of serialized employees by id; writers pop their id.
+# Other workers keep their copy until it expires; EMPLOYEE_CACHE_TTL=0 disables it.
+EMPLOYEE_CACHE_TTL = int(os.getenv("EMPLOYEE_CACHE_TTL", "30"))
+employee_cache = TTLCache(maxsize=10000, ttl=EMPLOYEE_CACHE_TTL)
+# Per-process cache of list pages by query parameters; writers clear it.
+# Other workers keep their copy until it expires; LIST_CACHE_TTL=0 disables it.
+LIST_CACHE_TTL = int(os.getenv("LIST_CACHE_TTL", "10"))
+list_cache = TTLCache(maxsize=1024, ttl=LIST_CACHE_TTL)
+# Bumped on every write; a read only fills a cache if no write landed while it queried
+write_generation = 0
+
+def invalidate_employee(id: int):
+    global write_generation
+    write_generation += 1
+    employee_cache.pop(id, None)
+
+def invalidate_lists():
+    global write_generation
+    write_generation += 1
+    list_cache.clear()
+
+async def get_employee_cached(db: AsyncSession, id: int):
+    cached = employee_cache.get(id)
+    if cached is not None:
+        return cached
+    generation = write_generation
+    emp = await db.get(Employee, id)
+    if emp is None:
+        return None
+    cached = EmployeeResponse.model_validate(emp)
+    if generation == write_generation:
+        employee_cache[id] = cached
+    return cached
+
+async def list_employees_cached(db: AsyncSession, department=None, role=None, after_id=None, page=None):
+    key = (department, role, after_id, page)
+    cached = list_cache.get(key)
+    if cached is not None:
+        return cached
+    generation = write_generation
+    filters = []
+    if department:
+        filters.append(Employee.department == department)
+    if role:
+        filters.append(Employee.role == role)
+    if after_id is None and page and page > 1:
+        # Legacy page numbers: find the last id of the previous page, then seek
+        seek = select(Employee.id).where(*filters).order_by(Employee.id)
+        after_id = await db.scalar(seek.offset((page-1)*PAGE_SIZE - 1).limit(1))
+        if after_id is None:
+            cached = EmployeePage(items=[])
+            if generation == write_generation:
+                list_cache[key] = cached
+            return cached
+    if after_id is not None:
+        filters.append(Employee.id > after_id)
+    # One extra row tells us whether there is a next page
+    stmt = select(*LIST_COLUMNS).where(*filters).order_by(Employee.id).limit(PAGE_SIZE + 1)
+    items = (await db.execute(stmt)).mappings().all()
+    next_id = items[PAGE_SIZE - 1]["id"] if len(items) > PAGE_SIZE else None
+    cached = EmployeePage(items=items[:PAGE_SIZE], next=next_id)
+    if generation == write_generation:
+        list_cache[key] = cached
+    return cached
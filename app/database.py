@@ -1,8 +1,19 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import os
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base
 
-DATABASE_URL = "sqlite:///./employees.db"
+# Use postgresql+asyncpg://... in production
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./employees.db")
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(bind=engine, autoflush=False)
+# Per process: the server can hold up to (DB_POOL_SIZE + DB_MAX_OVERFLOW) x workers connections
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+    pool_timeout=5,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    query_cache_size=1200,
+)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
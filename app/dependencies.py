@@ -1,12 +1,27 @@
+import time
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt
+import jwt
 from .auth import SECRET_KEY, ALGORITHM
 
 security = HTTPBearer()
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
+# Built once at import so cache misses don't redo the setup per call
+_KEY = SECRET_KEY.encode()
+_ALGORITHMS = [ALGORITHM]
+# Expiry is checked by the caller so a cached entry stays usable until exp
+_decoder = jwt.PyJWT(options={"verify_exp": False})
+
+@lru_cache(maxsize=4096)
+def _decode_cached(token: str):
+    payload = _decoder.decode(token, _KEY, algorithms=_ALGORITHMS)
+    return payload, payload["exp"]
+
+async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     try:
-        jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        _, exp = _decode_cached(credentials.credentials)
     except:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    if exp <= time.time():
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
@@ -1,69 +1,92 @@
-from fastapi import FastAPI, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from .database import Base, engine, SessionLocal
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, HTTPException, Query
+from sqlalchemy import update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from .database import engine, SessionLocal
 from .models import Employee
-from .schemas import EmployeeCreate, EmployeeResponse
+from .schemas import EmployeeCreate, EmployeeResponse, EmployeePage, Token, HealthStatus
 from .auth import create_access_token
 from .dependencies import verify_token
-from .crud import get_employee_by_email
+from .crud import get_employee_cached, list_employees_cached, invalidate_employee, invalidate_lists
 
-Base.metadata.create_all(bind=engine)
+# Schema changes are applied with `alembic upgrade head`, not at startup
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await engine.dispose()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-@app.post("/token")
-def login():
+@app.get("/healthz", response_model=HealthStatus)
+async def healthz():
+    return {"status": "ok", "pool": engine.pool.status()}
+
+@app.post("/token", response_model=Token)
+async def login():
     return {"access_token": create_access_token()}
 
 @app.post("/api/employees/", response_model=EmployeeResponse, status_code=201, dependencies=[Depends(verify_token)])
-def create_employee(emp: EmployeeCreate, db: Session = Depends(get_db)):
-    if get_employee_by_email(db, emp.email):
-        raise HTTPException(status_code=400, detail="Email exists")
-    employee = Employee(**emp.dict())
+async def create_employee(emp: EmployeeCreate, db: AsyncSession = Depends(get_db)):
+    employee = Employee(**emp.model_dump())
     db.add(employee)
-    db.commit()
-    db.refresh(employee)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Email exists")
+    invalidate_lists()
+    await db.refresh(employee)
     return employee
 
-@app.get("/api/employees/", response_model=List[EmployeeResponse], dependencies=[Depends(verify_token)])
-def list_employees(department: str = None, role: str = None, page: int = 1, db: Session = Depends(get_db)):
-    q = db.query(Employee)
-    if department:
-        q = q.filter(Employee.department == department)
-    if role:
-        q = q.filter(Employee.role == role)
-    return q.offset((page-1)*10).limit(10).all()
+@app.get("/api/employees/", response_model=EmployeePage, dependencies=[Depends(verify_token)])
+async def list_employees(
+    department: str = None,
+    role: str = None,
+    after_id: Optional[int] = None,
+    page: Optional[int] = Query(None, ge=1, deprecated=True),
+    db: AsyncSession = Depends(get_db),
+):
+    return await list_employees_cached(db, department, role, after_id, page)
 
 @app.get("/api/employees/{id}", response_model=EmployeeResponse, dependencies=[Depends(verify_token)])
-def get_employee(id: int, db: Session = Depends(get_db)):
-    emp = db.get(Employee, id)
+async def get_employee(id: int, db: AsyncSession = Depends(get_db)):
+    emp = await get_employee_cached(db, id)
     if not emp:
         raise HTTPException(status_code=404)
     return emp
 
 @app.put("/api/employees/{id}", response_model=EmployeeResponse, dependencies=[Depends(verify_token)])
-def update_employee(id: int, emp: EmployeeCreate, db: Session = Depends(get_db)):
-    employee = db.get(Employee, id)
+async def update_employee(id: int, emp: EmployeeCreate, db: AsyncSession = Depends(get_db)):
+    stmt = (
+        update(Employee)
+        .where(Employee.id == id)
+        .values(**emp.model_dump())
+        .returning(Employee)
+        .execution_options(synchronize_session=False)
+    )
+    try:
+        employee = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Email exists")
     if not employee:
         raise HTTPException(status_code=404)
-    for k, v in emp.dict().items():
-        setattr(employee, k, v)
-    db.commit()
-    db.refresh(employee)
+    invalidate_employee(id)
+    invalidate_lists()
     return employee
 
 @app.delete("/api/employees/{id}", status_code=204, dependencies=[Depends(verify_token)])
-def delete_employee(id: int, db: Session = Depends(get_db)):
-    employee = db.get(Employee, id)
-    if not employee:
+async def delete_employee(id: int, db: AsyncSession = Depends(get_db)):
+    stmt = delete(Employee).where(Employee.id == id).returning(Employee.id)
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
         raise HTTPException(status_code=404)
-    db.delete(employee)
-    db.commit()
+    await db.commit()
+    invalidate_employee(id)
+    invalidate_lists()
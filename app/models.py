@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Integer, String, Date, Index
 from datetime import date
 from .database import Base
 
 class Employee(Base):
     __tablename__ = "employees"
+    __table_args__ = (Index("ix_emp_dept_role", "department", "role"),)
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 class EmployeeCreate(BaseModel):
     name: str
@@ -9,8 +9,18 @@ class EmployeeCreate(BaseModel):
     role: Optional[str] = None
 
 class EmployeeResponse(EmployeeCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     date_joined: date
 
-    class Config:
-        orm_mode = True
+class EmployeePage(BaseModel):
+    items: List[EmployeeResponse]
+    next: Optional[int] = None
+
+class Token(BaseModel):
+    access_token: str
+
+class HealthStatus(BaseModel):
+    status: str
+    pool: str
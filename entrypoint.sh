@@ -0,0 +1,22 @@
+#!/bin/sh
+set -e
+
+: "${JWT_SECRET:?JWT_SECRET must be set to the token signing secret}"
+
+# Apply migrations once up front so workers don't race to run the DDL
+alembic upgrade head
+
+# WEB_CONCURRENCY overrides the worker count (defaults to one per CPU)
+WORKERS="${WEB_CONCURRENCY:-$(nproc)}"
+
+# The response caches are per process and a write only invalidates the worker
+# that handled it, so with several workers they stay off unless set explicitly
+if [ "$WORKERS" -gt 1 ]; then
+    export EMPLOYEE_CACHE_TTL="${EMPLOYEE_CACHE_TTL:-0}"
+    export LIST_CACHE_TTL="${LIST_CACHE_TTL:-0}"
+fi
+
+exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8000}" \
+    --workers "$WORKERS" \
+    --loop uvloop --http httptools \
+    --limit-concurrency 1000 --timeout-keep-alive 30
@@ -0,0 +1,27 @@
+"""add employee department/role index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 07:12:40.118525
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_emp_dept_role', 'employees', ['department', 'role'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_emp_dept_role', table_name='employees')
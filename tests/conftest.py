@@ -0,0 +1,4 @@
+import os
+
+# The app refuses to start without a signing secret; give the test run its own
+os.environ.setdefault("JWT_SECRET", "test-only-jwt-secret-for-the-pytest-suite")
@@ -1,61 +1,135 @@
+import asyncio
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from datetime import datetime, timedelta
+import jwt
 from app.main import app, get_db
 from app.database import Base
+from app.models import Employee
+from app.auth import SECRET_KEY, ALGORITHM
+from app.crud import employee_cache, list_cache
 
 # Setup test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+FixtureSessionLocal = sessionmaker(bind=engine)
+TestingSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
-Base.metadata.create_all(bind=engine)
-
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
+async def override_get_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
-client = TestClient(app)
+
+pytestmark = pytest.mark.asyncio
 
 # Test fixtures
+@pytest.fixture(scope="session", autouse=True)
+def create_schema():
+    """Build the schema once; tests only clear rows between runs"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+
 @pytest.fixture(autouse=True)
 def reset_db():
     """Reset database before each test"""
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    employee_cache.clear()
+    list_cache.clear()
     yield
 
-def get_valid_token():
+@pytest.fixture
+def bulk_employees():
+    """Insert employee rows directly, bypassing the HTTP API"""
+    def insert(rows):
+        with FixtureSessionLocal() as session:
+            session.bulk_insert_mappings(Employee, rows)
+            session.commit()
+    return insert
+
+@pytest.fixture
+def stall_read(monkeypatch):
+    """Hold the first AsyncSession read after it returns until released"""
+    def install(method):
+        read_done, release = asyncio.Event(), asyncio.Event()
+        original = getattr(AsyncSession, method)
+        async def stalled(self, *args, **kwargs):
+            result = await original(self, *args, **kwargs)
+            if not read_done.is_set():
+                read_done.set()
+                await release.wait()
+            return result
+        monkeypatch.setattr(AsyncSession, method, stalled)
+        return read_done, release
+    return install
+
+@pytest_asyncio.fixture
+async def client():
+    """Async HTTP client calling the app in-process"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+async def get_valid_token(client):
     """Helper to get a valid JWT token"""
-    response = client.post("/token")
+    response = await client.post("/token")
     return response.json()["access_token"]
 
+# ==================== HEALTH CHECK TESTS ====================
+
+async def test_healthz(client):
+    """Test GET /healthz reports connection pool status without auth"""
+    response = await client.get("/healthz")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+    assert "Pool size: 20" in response.json()["pool"]
+
 # ==================== AUTHENTICATION TESTS ====================
 
-def test_get_token():
+async def test_get_token(client):
     """Test POST /token endpoint returns access token"""
-    response = client.post("/token")
+    response = await client.post("/token")
     assert response.status_code == 200
     assert "access_token" in response.json()
     assert response.json()["access_token"] is not None
 
+async def test_get_token_reused_until_near_expiry(client):
+    """Test POST /token hands out the same token while it is still fresh"""
+    first = (await client.post("/token")).json()["access_token"]
+    second = (await client.post("/token")).json()["access_token"]
+    assert first == second
+
+async def test_expired_token_rejected(client):
+    """Test an expired token is rejected even after a valid decode was cached"""
+    payload = {"sub": "admin", "exp": datetime.utcnow() - timedelta(seconds=1)}
+    token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    for _ in range(2):
+        response = await client.get(
+            "/api/employees/",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 401
+
 # ==================== CREATE EMPLOYEE TESTS ====================
 
-def test_create_employee_success():
+async def test_create_employee_success(client):
     """Test creating employee with valid data"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     employee_data = {
         "name": "John Doe",
         "email": "john@example.com",
         "department": "Engineering",
         "role": "Software Engineer"
     }
-    response = client.post(
+    response = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -66,9 +140,9 @@ def test_create_employee_success():
     assert data["email"] == "john@example.com"
     assert data["id"] is not None
 
-def test_create_employee_duplicate_email():
+async def test_create_employee_duplicate_email(client):
     """Test creating employee with duplicate email fails"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     employee_data = {
         "name": "John Doe",
         "email": "john@example.com",
@@ -77,7 +151,7 @@ def test_create_employee_duplicate_email():
     }
     
     # Create first employee
-    response1 = client.post(
+    response1 = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -85,7 +159,7 @@ def test_create_employee_duplicate_email():
     assert response1.status_code == 201
     
     # Try to create duplicate
-    response2 = client.post(
+    response2 = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -93,7 +167,7 @@ def test_create_employee_duplicate_email():
     assert response2.status_code == 400
     assert "Email exists" in response2.json()["detail"]
 
-def test_create_employee_without_auth():
+async def test_create_employee_without_auth(client):
     """Test creating employee without token fails"""
     employee_data = {
         "name": "John Doe",
@@ -101,19 +175,19 @@ def test_create_employee_without_auth():
         "department": "Engineering",
         "role": "Software Engineer"
     }
-    response = client.post("/api/employees/", json=employee_data)
+    response = await client.post("/api/employees/", json=employee_data)
     assert response.status_code == 401
 
-def test_create_employee_invalid_email():
+async def test_create_employee_invalid_email(client):
     """Test creating employee with invalid email format"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     employee_data = {
         "name": "John Doe",
         "email": "not-an-email",
         "department": "Engineering",
         "role": "Developer"
     }
-    response = client.post(
+    response = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -122,141 +196,208 @@ def test_create_employee_invalid_email():
 
 # ==================== LIST EMPLOYEES TESTS ====================
 
-def test_list_employees_empty():
+async def test_list_employees_empty(client):
     """Test listing employees when database is empty"""
-    token = get_valid_token()
-    response = client.get(
+    token = await get_valid_token(client)
+    response = await client.get(
         "/api/employees/",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"items": [], "next": None}
 
-def test_list_employees_success():
+async def test_list_employees_success(client, bulk_employees):
     """Test listing employees returns all employees"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create multiple employees
-    for i in range(3):
-        employee_data = {
+    bulk_employees([
+        {
             "name": f"Employee {i}",
             "email": f"employee{i}@example.com",
             "department": "Engineering",
             "role": "Developer"
         }
-        client.post(
-            "/api/employees/",
-            json=employee_data,
-            headers={"Authorization": f"Bearer {token}"}
-        )
+        for i in range(3)
+    ])
     
-    response = client.get(
+    response = await client.get(
         "/api/employees/",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 200
-    assert len(response.json()) == 3
+    assert len(response.json()["items"]) == 3
 
-def test_list_employees_filter_by_department():
+async def test_list_employees_filter_by_department(client, bulk_employees):
     """Test filtering employees by department"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create employees in different departments
-    departments = [
+    bulk_employees([
         {"name": "Alice", "email": "alice@example.com", "department": "Engineering", "role": "Dev"},
         {"name": "Bob", "email": "bob@example.com", "department": "HR", "role": "Manager"},
         {"name": "Charlie", "email": "charlie@example.com", "department": "Engineering", "role": "Dev"},
-    ]
-    
-    for emp in departments:
-        client.post(
-            "/api/employees/",
-            json=emp,
-            headers={"Authorization": f"Bearer {token}"}
-        )
+    ])
     
     # Filter by Engineering
-    response = client.get(
+    response = await client.get(
         "/api/employees/?department=Engineering",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 200
-    assert len(response.json()) == 2
-    for emp in response.json():
+    assert len(response.json()["items"]) == 2
+    for emp in response.json()["items"]:
         assert emp["department"] == "Engineering"
 
-def test_list_employees_filter_by_role():
+async def test_list_employees_filter_by_role(client, bulk_employees):
     """Test filtering employees by role"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create employees with different roles
-    roles = [
+    bulk_employees([
         {"name": "Alice", "email": "alice@example.com", "department": "Engineering", "role": "Senior Dev"},
         {"name": "Bob", "email": "bob@example.com", "department": "Engineering", "role": "Junior Dev"},
         {"name": "Charlie", "email": "charlie@example.com", "department": "Engineering", "role": "Senior Dev"},
-    ]
-    
-    for emp in roles:
-        client.post(
-            "/api/employees/",
-            json=emp,
-            headers={"Authorization": f"Bearer {token}"}
-        )
+    ])
     
     # Filter by Senior Dev
-    response = client.get(
+    response = await client.get(
         "/api/employees/?role=Senior Dev",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 200
-    assert len(response.json()) == 2
-    for emp in response.json():
+    assert len(response.json()["items"]) == 2
+    for emp in response.json()["items"]:
         assert emp["role"] == "Senior Dev"
 
-def test_list_employees_pagination():
+async def test_list_employees_pagination(client, bulk_employees):
     """Test pagination with page parameter"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create 15 employees (more than one page)
-    for i in range(15):
-        employee_data = {
+    bulk_employees([
+        {
             "name": f"Employee {i:02d}",
             "email": f"emp{i:02d}@example.com",
             "department": "Engineering",
             "role": "Developer"
         }
-        client.post(
-            "/api/employees/",
-            json=employee_data,
-            headers={"Authorization": f"Bearer {token}"}
-        )
+        for i in range(15)
+    ])
     
     # Get page 1
-    response1 = client.get(
+    response1 = await client.get(
         "/api/employees/?page=1",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response1.status_code == 200
-    assert len(response1.json()) == 10
+    assert len(response1.json()["items"]) == 10
     
     # Get page 2
-    response2 = client.get(
+    response2 = await client.get(
         "/api/employees/?page=2",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response2.status_code == 200
-    assert len(response2.json()) == 5
+    assert len(response2.json()["items"]) == 5
+    assert response2.json()["next"] is None
+
+async def test_list_employees_keyset_pagination(client, bulk_employees):
+    """Test paging with the after_id cursor returned as next"""
+    token = await get_valid_token(client)
+    bulk_employees([
+        {"name": f"Employee {i:02d}", "email": f"emp{i:02d}@example.com"}
+        for i in range(15)
+    ])
+
+    response1 = await client.get(
+        "/api/employees/",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response1.status_code == 200
+    page1 = response1.json()
+    assert len(page1["items"]) == 10
+    assert page1["next"] == page1["items"][-1]["id"]
 
-def test_list_employees_without_auth():
+    response2 = await client.get(
+        f"/api/employees/?after_id={page1['next']}",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response2.status_code == 200
+    page2 = response2.json()
+    assert len(page2["items"]) == 5
+    assert page2["next"] is None
+    assert page2["items"][0]["id"] > page1["items"][-1]["id"]
+
+async def test_list_employees_after_create_not_stale(client):
+    """Test a cached listing is invalidated by a later create"""
+    token = await get_valid_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await client.get("/api/employees/", headers=headers)
+    assert response.json()["items"] == []
+
+    await client.post(
+        "/api/employees/",
+        json={"name": "Alice", "email": "alice@example.com"},
+        headers=headers
+    )
+    response = await client.get("/api/employees/", headers=headers)
+    assert len(response.json()["items"]) == 1
+
+async def test_list_employees_overlapping_create_not_cached(client, stall_read):
+    """Test a listing that queried before a create doesn't cache the old page"""
+    token = await get_valid_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    read_done, release = stall_read("execute")
+    pending = asyncio.create_task(client.get("/api/employees/", headers=headers))
+    await read_done.wait()
+    create_response = await client.post(
+        "/api/employees/",
+        json={"name": "Alice", "email": "alice@example.com"},
+        headers=headers
+    )
+    assert create_response.status_code == 201
+    release.set()
+    assert (await pending).json()["items"] == []
+
+    response = await client.get("/api/employees/", headers=headers)
+    assert len(response.json()["items"]) == 1
+
+async def test_list_employees_legacy_page_overlapping_create_not_cached(client, bulk_employees, stall_read):
+    """Test an empty legacy page seen before a create isn't cached"""
+    token = await get_valid_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    bulk_employees([
+        {"name": f"Employee {i:02d}", "email": f"emp{i:02d}@example.com"}
+        for i in range(9)
+    ])
+
+    read_done, release = stall_read("scalar")
+    pending = asyncio.create_task(client.get("/api/employees/?page=2", headers=headers))
+    await read_done.wait()
+    for name in ("Alice", "Bob"):
+        await client.post(
+            "/api/employees/",
+            json={"name": name, "email": f"{name.lower()}@example.com"},
+            headers=headers
+        )
+    release.set()
+    assert (await pending).json()["items"] == []
+
+    response = await client.get("/api/employees/?page=2", headers=headers)
+    assert len(response.json()["items"]) == 1
+
+async def test_list_employees_without_auth(client):
     """Test listing employees without token fails"""
-    response = client.get("/api/employees/")
+    response = await client.get("/api/employees/")
     assert response.status_code == 401
 
 # ==================== GET EMPLOYEE BY ID TESTS ====================
 
-def test_get_employee_by_id_success():
+async def test_get_employee_by_id_success(client):
     """Test getting employee by valid ID"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create an employee
     employee_data = {
@@ -266,7 +407,7 @@ def test_get_employee_by_id_success():
         "role": "Software Engineer",
         "salary": 75000
     }
-    create_response = client.post(
+    create_response = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -274,7 +415,7 @@ def test_get_employee_by_id_success():
     emp_id = create_response.json()["id"]
     
     # Get the employee
-    response = client.get(
+    response = await client.get(
         f"/api/employees/{emp_id}",
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -282,25 +423,25 @@ def test_get_employee_by_id_success():
     assert response.json()["id"] == emp_id
     assert response.json()["name"] == "John Doe"
 
-def test_get_employee_not_found():
+async def test_get_employee_not_found(client):
     """Test getting employee with non-existent ID"""
-    token = get_valid_token()
-    response = client.get(
+    token = await get_valid_token(client)
+    response = await client.get(
         "/api/employees/999",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 404
 
-def test_get_employee_without_auth():
+async def test_get_employee_without_auth(client):
     """Test getting employee without token fails"""
-    response = client.get("/api/employees/1")
+    response = await client.get("/api/employees/1")
     assert response.status_code == 401
 
 # ==================== UPDATE EMPLOYEE TESTS ====================
 
-def test_update_employee_success():
+async def test_update_employee_success(client):
     """Test updating employee with valid data"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create an employee
     employee_data = {
@@ -309,7 +450,7 @@ def test_update_employee_success():
         "department": "Engineering",
         "role": "Software Engineer"
     }
-    create_response = client.post(
+    create_response = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -323,7 +464,7 @@ def test_update_employee_success():
         "department": "Management",
         "role": "Team Lead"
     }
-    response = client.put(
+    response = await client.put(
         f"/api/employees/{emp_id}",
         json=updated_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -332,9 +473,9 @@ def test_update_employee_success():
     assert response.json()["name"] == "Jane Doe"
     assert response.json()["role"] == "Team Lead"
 
-def test_update_employee_not_found():
+async def test_update_employee_not_found(client):
     """Test updating non-existent employee"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     updated_data = {
         "name": "Jane Doe",
         "email": "jane@example.com",
@@ -342,16 +483,16 @@ def test_update_employee_not_found():
         "role": "Team Lead",
         "salary": 95000
     }
-    response = client.put(
+    response = await client.put(
         "/api/employees/999",
         json=updated_data,
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 404
 
-def test_update_employee_partial():
+async def test_update_employee_partial(client):
     """Test partial update of employee"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create an employee
     employee_data = {
@@ -360,7 +501,7 @@ def test_update_employee_partial():
         "department": "Engineering",
         "role": "Software Engineer"
     }
-    create_response = client.post(
+    create_response = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -374,7 +515,7 @@ def test_update_employee_partial():
         "department": "Engineering",
         "role": "Senior Software Engineer"
     }
-    response = client.put(
+    response = await client.put(
         f"/api/employees/{emp_id}",
         json=updated_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -383,7 +524,31 @@ def test_update_employee_partial():
     assert response.json()["role"] == "Senior Software Engineer"
     assert response.json()["name"] == "John Doe"
 
-def test_update_employee_without_auth():
+async def test_update_employee_duplicate_email(client):
+    """Test updating employee to another employee's email fails"""
+    token = await get_valid_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.post(
+        "/api/employees/",
+        json={"name": "Alice", "email": "alice@example.com"},
+        headers=headers
+    )
+    create_response = await client.post(
+        "/api/employees/",
+        json={"name": "Bob", "email": "bob@example.com"},
+        headers=headers
+    )
+    emp_id = create_response.json()["id"]
+
+    response = await client.put(
+        f"/api/employees/{emp_id}",
+        json={"name": "Bob", "email": "alice@example.com"},
+        headers=headers
+    )
+    assert response.status_code == 400
+    assert "Email exists" in response.json()["detail"]
+
+async def test_update_employee_without_auth(client):
     """Test updating employee without token fails"""
     updated_data = {
         "name": "Jane Doe",
@@ -391,14 +556,55 @@ def test_update_employee_without_auth():
         "department": "Management",
         "role": "Team Lead"
     }
-    response = client.put("/api/employees/1", json=updated_data)
+    response = await client.put("/api/employees/1", json=updated_data)
     assert response.status_code == 401
 
+async def test_get_employee_after_update_not_stale(client):
+    """Test a cached GET is invalidated by a later update"""
+    token = await get_valid_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    employee_data = {
+        "name": "John Doe",
+        "email": "john@example.com",
+        "department": "Engineering",
+        "role": "Software Engineer"
+    }
+    emp_id = (await client.post("/api/employees/", json=employee_data, headers=headers)).json()["id"]
+    assert (await client.get(f"/api/employees/{emp_id}", headers=headers)).json()["role"] == "Software Engineer"
+
+    employee_data["role"] = "Staff Engineer"
+    await client.put(f"/api/employees/{emp_id}", json=employee_data, headers=headers)
+    response = await client.get(f"/api/employees/{emp_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["role"] == "Staff Engineer"
+
+async def test_get_employee_overlapping_delete_not_cached(client, stall_read):
+    """Test a GET that read the row before a delete doesn't cache it afterwards"""
+    token = await get_valid_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    create_response = await client.post(
+        "/api/employees/",
+        json={"name": "John Doe", "email": "john@example.com"},
+        headers=headers
+    )
+    emp_id = create_response.json()["id"]
+
+    read_done, release = stall_read("get")
+    pending = asyncio.create_task(client.get(f"/api/employees/{emp_id}", headers=headers))
+    await read_done.wait()
+    delete_response = await client.delete(f"/api/employees/{emp_id}", headers=headers)
+    assert delete_response.status_code == 204
+    release.set()
+    assert (await pending).status_code == 200
+
+    response = await client.get(f"/api/employees/{emp_id}", headers=headers)
+    assert response.status_code == 404
+
 # ==================== DELETE EMPLOYEE TESTS ====================
 
-def test_delete_employee_success():
+async def test_delete_employee_success(client):
     """Test deleting employee"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create an employee
     employee_data = {
@@ -408,7 +614,7 @@ def test_delete_employee_success():
         "role": "Software Engineer",
         "salary": 75000
     }
-    create_response = client.post(
+    create_response = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -416,38 +622,38 @@ def test_delete_employee_success():
     emp_id = create_response.json()["id"]
     
     # Delete the employee
-    response = client.delete(
+    response = await client.delete(
         f"/api/employees/{emp_id}",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 204
     
     # Verify employee is deleted
-    get_response = client.get(
+    get_response = await client.get(
         f"/api/employees/{emp_id}",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert get_response.status_code == 404
 
-def test_delete_employee_not_found():
+async def test_delete_employee_not_found(client):
     """Test deleting non-existent employee"""
-    token = get_valid_token()
-    response = client.delete(
+    token = await get_valid_token(client)
+    response = await client.delete(
         "/api/employees/999",
         headers={"Authorization": f"Bearer {token}"}
     )
     assert response.status_code == 404
 
-def test_delete_employee_without_auth():
+async def test_delete_employee_without_auth(client):
     """Test deleting employee without token fails"""
-    response = client.delete("/api/employees/1")
+    response = await client.delete("/api/employees/1")
     assert response.status_code == 401
 
 # ==================== INTEGRATION TESTS ====================
 
-def test_full_crud_workflow():
+async def test_full_crud_workflow(client):
     """Test complete CRUD workflow"""
-    token = get_valid_token()
+    token = await get_valid_token(client)
     
     # Create
     employee_data = {
@@ -456,7 +662,7 @@ def test_full_crud_workflow():
         "department": "Testing",
         "role": "QA Engineer"
     }
-    create_response = client.post(
+    create_response = await client.post(
         "/api/employees/",
         json=employee_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -465,7 +671,7 @@ def test_full_crud_workflow():
     emp_id = create_response.json()["id"]
     
     # Read
-    get_response = client.get(
+    get_response = await client.get(
         f"/api/employees/{emp_id}",
         headers={"Authorization": f"Bearer {token}"}
     )
@@ -478,7 +684,7 @@ def test_full_crud_workflow():
         "department": "Testing",
         "role": "Senior QA Engineer"
     }
-    update_response = client.put(
+    update_response = await client.put(
         f"/api/employees/{emp_id}",
         json=updated_data,
         headers={"Authorization": f"Bearer {token}"}
@@ -486,7 +692,7 @@ def test_full_crud_workflow():
     assert update_response.status_code == 200
     
     # Delete
-    delete_response = client.delete(
+    delete_response = await client.delete(
         f"/api/employees/{emp_id}",
         headers={"Authorization": f"Bearer {token}"}
     )